@@ -4,11 +4,11 @@ Add all Swift files to Xcode project
 """
 
 import re
-import uuid
 
-def generate_uuid():
-    """Generate a 24-character UUID for Xcode project"""
-    return ''.join(str(uuid.uuid4()).replace('-', '').upper()[:24])
+from pbxproj_utils import apply_edits, gen_id, insert_build_file, insert_file_ref, write_pbxproj
+
+SOURCES_RE = re.compile(r'884CA7142E6CF28200051F1A /\* ProfileView\.swift in Sources \*/,')
+GROUP_RE = re.compile(r'884CA70F2E6CF28200051F1A /\* SharedUIComponents\.swift \*/,')
 
 def add_swift_files_to_xcode():
     """Add all Swift files to Xcode project"""
@@ -58,54 +58,43 @@ def add_swift_files_to_xcode():
     build_files = {}
     
     for file in new_files:
-        file_refs[file] = generate_uuid()
-        build_files[file] = generate_uuid()
+        file_refs[file] = gen_id()
+        build_files[file] = gen_id()
         print(f"Adding {file} to Xcode project")
     
     # Add file references
-    file_ref_pattern = r'(.*884CA70F2E6CF28200051F1A /\* SharedUIComponents\.swift \*/ = \{isa = PBXFileReference; lastKnownFileType = sourcecode\.swift; path = SharedUIComponents\.swift; sourceTree = "<group>"; \};.*)'
-    
-    new_file_refs = []
-    for file, file_id in file_refs.items():
-        new_file_refs.append(f'\t\t{file_id} /* {file} */ = {{isa = PBXFileReference; lastKnownFileType = sourcecode.swift; path = {file}; sourceTree = "<group>"; }};')
-    
-    file_ref_replacement = r'\1\n' + '\n'.join(new_file_refs)
-    content = re.sub(file_ref_pattern, file_ref_replacement, content, flags=re.DOTALL)
+    content = insert_file_ref(content, [(file_id, file) for file, file_id in file_refs.items()])
     
     # Add build files
-    build_file_pattern = r'(.*884CA7142E6CF28200051F1A /\* ProfileView\.swift in Sources \*/ = \{isa = PBXBuildFile; fileRef = 884CA70E2E6CF28200051F1A /\* ProfileView\.swift \*/; \};.*)'
+    content = insert_build_file(content, [(build_id, file_refs[file], file) for file, build_id in build_files.items()])
     
-    new_build_files = []
-    for file, build_id in build_files.items():
-        file_id = file_refs[file]
-        new_build_files.append(f'\t\t{build_id} /* {file} in Sources */ = {{isa = PBXBuildFile; fileRef = {file_id} /* {file} */; }};')
-    
-    build_file_replacement = r'\1\n' + '\n'.join(new_build_files)
-    content = re.sub(build_file_pattern, build_file_replacement, content, flags=re.DOTALL)
+    # Collect (offset, text) inserts and apply them in one pass at the end
+    edits = []
     
     # Add to Sources build phase
-    sources_pattern = r'(.*884CA7142E6CF28200051F1A /\* ProfileView\.swift in Sources \*/,.*)'
-    
     new_sources = []
     for file, build_id in build_files.items():
         new_sources.append(f'\t\t\t\t{build_id} /* {file} in Sources */,')
     
-    sources_replacement = r'\1\n' + '\n'.join(new_sources)
-    content = re.sub(sources_pattern, sources_replacement, content, flags=re.DOTALL)
+    sources_insertion = '\n' + '\n'.join(new_sources)
+    match = SOURCES_RE.search(content)
+    if match:
+        edits.append((match.end(), sources_insertion))
     
     # Add to main group
-    group_pattern = r'(.*884CA70F2E6CF28200051F1A /\* SharedUIComponents\.swift \*/,.*)'
-    
     new_group_items = []
     for file, file_id in file_refs.items():
         new_group_items.append(f'\t\t\t\t{file_id} /* {file} */,')
     
-    group_replacement = r'\1\n' + '\n'.join(new_group_items)
-    content = re.sub(group_pattern, group_replacement, content, flags=re.DOTALL)
+    group_insertion = '\n' + '\n'.join(new_group_items)
+    match = GROUP_RE.search(content)
+    if match:
+        edits.append((match.end(), group_insertion))
+    
+    content = apply_edits(content, edits)
     
     # Write the updated content
-    with open(project_file, 'w') as f:
-        f.write(content)
+    write_pbxproj(project_file, content)
     
     print("Successfully added Swift files to Xcode project!")
 
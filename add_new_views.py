@@ -1,7 +1,6 @@
 #!/usr/bin/env python3
 
-import re
-import uuid
+from pbxproj_utils import gen_id, insert_build_file, insert_file_ref, insert_group_entry, insert_source_entry, write_pbxproj
 
 def add_files_to_xcode_project():
     """Add new view files to Xcode project"""
@@ -32,91 +31,35 @@ def add_files_to_xcode_project():
     with open(project_file, 'r') as f:
         content = f.read()
     
-    # Generate UUIDs for new files
-    file_uuids = {}
-    for file_path in new_files:
-        file_uuids[file_path] = str(uuid.uuid4()).replace('-', '').upper()[:24]
+    # Generate IDs and build every section's entries in a single pass over the files
+    file_refs = []
+    build_files = []
+    sources = []
     
     print(f"Adding {len(new_files)} files to Xcode project")
     for file_path in new_files:
-        print(f"  📄 {file_path} -> {file_uuids[file_path]}")
+        file_name = file_path.rsplit('/', 1)[-1]
+        file_uuid = gen_id()
+        build_uuid = gen_id()
+        file_refs.append((file_uuid, file_name))
+        build_files.append((build_uuid, file_uuid, file_name))
+        sources.append((build_uuid, file_name))
+        print(f"  📄 {file_path} -> {file_uuid}")
     
     # 1. Add file references to PBXFileReference section
-    file_ref_section = re.search(r'/\* Begin PBXFileReference section \*/(.*?)/\* End PBXFileReference section \*/', content, re.DOTALL)
-    if file_ref_section:
-        file_refs = file_ref_section.group(1)
-        
-        for file_path in new_files:
-            file_name = file_path.split('/')[-1]
-            file_uuid = file_uuids[file_path]
-            
-            # Add file reference
-            new_ref = f'\t\t{file_uuid} /* {file_name} */ = {{isa = PBXFileReference; lastKnownFileType = sourcecode.swift; path = "{file_name}"; sourceTree = "<group>"; }};\n'
-            file_refs += new_ref
-        
-        # Update content
-        new_file_ref_section = f'/* Begin PBXFileReference section */{file_refs}/* End PBXFileReference section */'
-        content = content.replace(file_ref_section.group(0), new_file_ref_section)
+    content = insert_file_ref(content, file_refs)
     
     # 2. Add build file references to PBXBuildFile section
-    build_file_section = re.search(r'/\* Begin PBXBuildFile section \*/(.*?)/\* End PBXBuildFile section \*/', content, re.DOTALL)
-    if build_file_section:
-        build_files = build_file_section.group(1)
-        
-        for file_path in new_files:
-            file_name = file_path.split('/')[-1]
-            file_uuid = file_uuids[file_path]
-            build_uuid = str(uuid.uuid4()).replace('-', '').upper()[:24]
-            
-            # Add build file reference
-            new_build_file = f'\t\t{build_uuid} /* {file_name} in Sources */ = {{isa = PBXBuildFile; fileRef = {file_uuid} /* {file_name} */; }};\n'
-            build_files += new_build_file
-        
-        # Update content
-        new_build_file_section = f'/* Begin PBXBuildFile section */{build_files}/* End PBXBuildFile section */'
-        content = content.replace(build_file_section.group(0), new_build_file_section)
+    content = insert_build_file(content, build_files)
     
-    # 3. Add files to Sources build phase
-    sources_section = re.search(r'/\* Sources \*/ = \{{(.*?)\}};', content, re.DOTALL)
-    if sources_section:
-        sources_content = sources_section.group(1)
-        
-        for file_path in new_files:
-            file_name = file_path.split('/')[-1]
-            file_uuid = file_uuids[file_path]
-            build_uuid = str(uuid.uuid4()).replace('-', '').upper()[:24]
-            
-            # Add to sources
-            new_source = f'\t\t\t\t{build_uuid} /* {file_name} in Sources */,\n'
-            sources_content += new_source
-        
-        # Update content
-        new_sources_section = f'/* Sources */ = {{{sources_content}}};'
-        content = content.replace(sources_section.group(0), new_sources_section)
+    # 3. Add files to the main WrestlePick group
+    content = insert_group_entry(content, file_refs)
     
-    # 4. Add files to appropriate groups
-    # Add to main group
-    main_group_section = re.search(r'/\* WrestlePick \*/ = \{{(.*?)\}};', content, re.DOTALL)
-    if main_group_section:
-        group_content = main_group_section.group(1)
-        
-        # Add Views group
-        views_group_uuid = str(uuid.uuid4()).replace('-', '').upper()[:24]
-        views_group = f'\t\t\t\t{views_group_uuid} /* Views */,\n'
-        group_content += views_group
-        
-        # Add Services group
-        services_group_uuid = str(uuid.uuid4()).replace('-', '').upper()[:24]
-        services_group = f'\t\t\t\t{services_group_uuid} /* Services */,\n'
-        group_content += services_group
-        
-        # Update content
-        new_main_group_section = f'/* WrestlePick */ = {{{group_content}}};'
-        content = content.replace(main_group_section.group(0), new_main_group_section)
+    # 4. Add files to Sources build phase
+    content = insert_source_entry(content, sources)
     
     # Write updated project file
-    with open(project_file, 'w') as f:
-        f.write(content)
+    write_pbxproj(project_file, content)
     
     print("✅ Successfully added new view files to Xcode project!")
     
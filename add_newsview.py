@@ -4,11 +4,13 @@ Add NewsView.swift to Xcode project
 """
 
 import re
-import uuid
 
-def generate_uuid():
-    """Generate a 24-character UUID for Xcode project"""
-    return ''.join(str(uuid.uuid4()).replace('-', '').upper()[:24])
+from pbxproj_utils import apply_edits, gen_id, write_pbxproj
+
+FILE_REF_RE = re.compile(r'884CA70D2E6CF28200051F1A /\* ContentView\.swift \*/ = \{isa = PBXFileReference; lastKnownFileType = sourcecode\.swift; path = ContentView\.swift; sourceTree = "<group>"; \};')
+BUILD_FILE_RE = re.compile(r'884CA7132E6CF28200051F1A /\* ContentView\.swift in Sources \*/ = \{isa = PBXBuildFile; fileRef = 884CA70D2E6CF28200051F1A /\* ContentView\.swift \*/; \};')
+SOURCES_RE = re.compile(r'884CA7132E6CF28200051F1A /\* ContentView\.swift in Sources \*/,')
+GROUP_RE = re.compile(r'884CA70D2E6CF28200051F1A /\* ContentView\.swift \*/,')
 
 def add_newsview_to_xcode():
     """Add NewsView.swift to Xcode project"""
@@ -20,40 +22,44 @@ def add_newsview_to_xcode():
         content = f.read()
     
     # Generate UUIDs for NewsView.swift
-    file_ref_id = generate_uuid()
-    build_file_id = generate_uuid()
+    file_ref_id = gen_id()
+    build_file_id = gen_id()
     
     print(f"Adding NewsView.swift to Xcode project")
     print(f"File ref ID: {file_ref_id}")
     print(f"Build file ID: {build_file_id}")
     
-    # Add file reference after ContentView.swift
-    file_ref_pattern = r'(.*884CA70D2E6CF28200051F1A /\* ContentView\.swift \*/ = \{isa = PBXFileReference; lastKnownFileType = sourcecode\.swift; path = ContentView\.swift; sourceTree = "<group>"; \};.*)'
+    # Collect (offset, text) inserts and apply them in one pass at the end
+    edits = []
     
-    file_ref_replacement = r'\1\n\t\t' + file_ref_id + ' /* NewsView.swift */ = {isa = PBXFileReference; lastKnownFileType = sourcecode.swift; path = NewsView.swift; sourceTree = "<group>"; };'
-    content = re.sub(file_ref_pattern, file_ref_replacement, content, flags=re.DOTALL)
+    # Add file reference after ContentView.swift
+    file_ref_insertion = '\n\t\t' + file_ref_id + ' /* NewsView.swift */ = {isa = PBXFileReference; lastKnownFileType = sourcecode.swift; path = NewsView.swift; sourceTree = "<group>"; };'
+    match = FILE_REF_RE.search(content)
+    if match:
+        edits.append((match.end(), file_ref_insertion))
     
     # Add build file after ContentView.swift
-    build_file_pattern = r'(.*884CA7132E6CF28200051F1A /\* ContentView\.swift in Sources \*/ = \{isa = PBXBuildFile; fileRef = 884CA70D2E6CF28200051F1A /\* ContentView\.swift \*/; \};.*)'
-    
-    build_file_replacement = r'\1\n\t\t' + build_file_id + ' /* NewsView.swift in Sources */ = {isa = PBXBuildFile; fileRef = ' + file_ref_id + ' /* NewsView.swift */; };'
-    content = re.sub(build_file_pattern, build_file_replacement, content, flags=re.DOTALL)
+    build_file_insertion = '\n\t\t' + build_file_id + ' /* NewsView.swift in Sources */ = {isa = PBXBuildFile; fileRef = ' + file_ref_id + ' /* NewsView.swift */; };'
+    match = BUILD_FILE_RE.search(content)
+    if match:
+        edits.append((match.end(), build_file_insertion))
     
     # Add to Sources build phase after ContentView.swift
-    sources_pattern = r'(.*884CA7132E6CF28200051F1A /\* ContentView\.swift in Sources \*/,.*)'
-    
-    sources_replacement = r'\1\n\t\t\t\t' + build_file_id + ' /* NewsView.swift in Sources */,'
-    content = re.sub(sources_pattern, sources_replacement, content, flags=re.DOTALL)
+    sources_insertion = '\n\t\t\t\t' + build_file_id + ' /* NewsView.swift in Sources */,'
+    match = SOURCES_RE.search(content)
+    if match:
+        edits.append((match.end(), sources_insertion))
     
     # Add to main group after ContentView.swift
-    group_pattern = r'(.*884CA70D2E6CF28200051F1A /\* ContentView\.swift \*/,.*)'
+    group_insertion = '\n\t\t\t\t' + file_ref_id + ' /* NewsView.swift */,'
+    match = GROUP_RE.search(content)
+    if match:
+        edits.append((match.end(), group_insertion))
     
-    group_replacement = r'\1\n\t\t\t\t' + file_ref_id + ' /* NewsView.swift */,'
-    content = re.sub(group_pattern, group_replacement, content, flags=re.DOTALL)
+    content = apply_edits(content, edits)
     
     # Write the updated content
-    with open(project_file, 'w') as f:
-        f.write(content)
+    write_pbxproj(project_file, content)
     
     print("Successfully added NewsView.swift to Xcode project!")
 
@@ -2,6 +2,8 @@
 
 import re
 
+from pbxproj_utils import write_pbxproj
+
 def clean_all_xcode_project():
     """Remove all deleted files from Xcode project and keep only ContentView.swift"""
     
@@ -21,25 +23,29 @@ def clean_all_xcode_project():
     file_refs = re.findall(file_ref_pattern, content, re.DOTALL)
     
     # Remove all file references except ContentView.swift
-    for file_id, filename in file_refs:
-        if filename not in files_to_keep:
-            # Remove PBXFileReference
-            file_ref_pattern = rf'{file_id} /\* {re.escape(filename)} \*/ = \{{isa = PBXFileReference;.*?\}};'
-            content = re.sub(file_ref_pattern, '', content, flags=re.DOTALL)
-            
-            # Remove PBXBuildFile
-            build_file_pattern = rf'[A-F0-9]{{24}} /\* {re.escape(filename)} in Sources \*/ = \{{isa = PBXBuildFile;.*?\}};'
-            content = re.sub(build_file_pattern, '', content, flags=re.DOTALL)
-            
-            # Remove from build phase
-            build_phase_pattern = rf'[A-F0-9]{{24}} /\* {re.escape(filename)} in Sources \*/,'
-            content = re.sub(build_phase_pattern, '', content)
-            
-            print(f"✅ Removed {filename}")
+    files_to_remove = list(dict.fromkeys(filename for _, filename in file_refs if filename not in files_to_keep))
+    
+    if files_to_remove:
+        # Build one alternation over every filename so each pattern scans the file once
+        names = '|'.join(re.escape(filename) for filename in files_to_remove)
+        file_ref_re = re.compile(rf'[A-F0-9]{{24}} /\* (?:{names}) \*/ = \{{isa = PBXFileReference;.*?\}};', re.DOTALL)
+        build_file_re = re.compile(rf'[A-F0-9]{{24}} /\* (?:{names}) in Sources \*/ = \{{isa = PBXBuildFile;.*?\}};', re.DOTALL)
+        build_phase_re = re.compile(rf'[A-F0-9]{{24}} /\* (?:{names}) in Sources \*/,')
+        
+        # Remove PBXFileReference
+        content = file_ref_re.sub('', content)
+        
+        # Remove PBXBuildFile
+        content = build_file_re.sub('', content)
+        
+        # Remove from build phase
+        content = build_phase_re.sub('', content)
+    
+    for filename in files_to_remove:
+        print(f"✅ Removed {filename}")
     
     # Write the cleaned project file
-    with open(project_file, 'w') as f:
-        f.write(content)
+    write_pbxproj(project_file, content)
     
     print("🎉 Project cleanup complete!")
 
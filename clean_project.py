@@ -2,6 +2,8 @@
 
 import re
 
+from pbxproj_utils import write_pbxproj
+
 def clean_xcode_project():
     """Remove deleted files from Xcode project"""
     
@@ -33,25 +35,30 @@ def clean_xcode_project():
         "NewsArticle.swift"
     ]
     
-    # Remove file references
-    for filename in files_to_remove:
+    # Skip names that never appear in the project; no removal pattern can match them
+    files_to_remove = [filename for filename in files_to_remove if f'/* {filename} ' in content]
+    
+    if files_to_remove:
+        # Build one alternation over every filename so each pattern scans the file once
+        names = '|'.join(re.escape(filename) for filename in files_to_remove)
+        file_ref_re = re.compile(rf'[A-F0-9]{{24}} /\* (?:{names}) \*/ = \{{isa = PBXFileReference;.*?\}};', re.DOTALL)
+        build_file_re = re.compile(rf'[A-F0-9]{{24}} /\* (?:{names}) in Sources \*/ = \{{isa = PBXBuildFile;.*?\}};', re.DOTALL)
+        build_phase_re = re.compile(rf'[A-F0-9]{{24}} /\* (?:{names}) in Sources \*/,')
+        
         # Remove PBXFileReference
-        file_ref_pattern = rf'[A-F0-9]{{24}} /\* {re.escape(filename)} \*/ = \{{isa = PBXFileReference;.*?\}};'
-        content = re.sub(file_ref_pattern, '', content, flags=re.DOTALL)
+        content = file_ref_re.sub('', content)
         
         # Remove PBXBuildFile
-        build_file_pattern = rf'[A-F0-9]{{24}} /\* {re.escape(filename)} in Sources \*/ = \{{isa = PBXBuildFile;.*?\}};'
-        content = re.sub(build_file_pattern, '', content, flags=re.DOTALL)
+        content = build_file_re.sub('', content)
         
         # Remove from build phase
-        build_phase_pattern = rf'[A-F0-9]{{24}} /\* {re.escape(filename)} in Sources \*/,'
-        content = re.sub(build_phase_pattern, '', content)
-        
+        content = build_phase_re.sub('', content)
+    
+    for filename in files_to_remove:
         print(f"✅ Removed {filename}")
     
     # Write the cleaned project file
-    with open(project_file, 'w') as f:
-        f.write(content)
+    write_pbxproj(project_file, content)
     
     print("🎉 Project cleanup complete!")
 
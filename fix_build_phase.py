@@ -1,19 +1,13 @@
 #!/usr/bin/env python3
 
-import re
-import uuid
+from pbxproj_utils import BUILDFILE_TMPL, stable_id
+from pbxproj_visitor import PbxprojVisitor, SOURCES_HEAD_RE
 
-def fix_build_phase():
-    """Fix the build phase to include all new files"""
-    
-    project_file = '/Users/jesse/IOS/WrestlePick/WrestlePick.xcodeproj/project.pbxproj'
+def fix_build_phase_step(visitor):
+    """Rebuild the Sources build phase in visitor from the files' existing references"""
     
     print("🔧 Fixing build phase to include all files...")
     
-    # Read project file
-    with open(project_file, 'r') as f:
-        content = f.read()
-    
     # Files that should be in the build phase
     files_to_build = [
         'WrestlePickApp.swift',
@@ -39,37 +33,50 @@ def fix_build_phase():
         'User.swift'
     ]
     
+    # Index the first UUID commented with each name in a single scan
+    uuid_by_name = visitor.uuid_by_name()
+    
     # Find the Sources build phase
-    sources_pattern = r'/\* Sources \*/ = \{{(.*?)\}};'
-    sources_match = re.search(sources_pattern, content, re.DOTALL)
+    files_span = visitor.list_span('PBXSourcesBuildPhase', SOURCES_HEAD_RE, 'files')
     
-    if sources_match:
-        sources_content = sources_match.group(1)
-        
+    if files_span:
         # Clear existing sources and add all files
-        new_sources = ""
+        source_parts = []
+        build_file_parts = []
         for file_name in files_to_build:
             # Find the UUID for this file
-            file_uuid_pattern = rf'([A-F0-9]{{24}}) /\* {re.escape(file_name)} \*/'
-            file_match = re.search(file_uuid_pattern, content)
+            file_uuid = uuid_by_name.get(file_name)
             
-            if file_match:
-                file_uuid = file_match.group(1)
-                build_uuid = str(uuid.uuid4()).replace('-', '').upper()[:24]
+            if file_uuid:
+                # Reuse the file's build file, creating one if it has none
+                build_uuid = uuid_by_name.get(f'{file_name} in Sources')
+                if not build_uuid:
+                    build_uuid = stable_id(file_name, 'buildFile')
+                    build_file_parts.append(BUILDFILE_TMPL % (build_uuid, file_name, file_uuid, file_name))
                 
                 # Add to sources
-                new_sources += f'\t\t\t\t{build_uuid} /* {file_name} in Sources */,\n'
+                source_parts.append(f'\n\t\t\t\t{build_uuid} /* {file_name} in Sources */,')
                 print(f"  ✅ Added {file_name} to build phase")
             else:
                 print(f"  ❌ Could not find UUID for {file_name}")
         
         # Update content
-        new_sources_section = f'/* Sources */ = {{{new_sources}}};'
-        content = content.replace(sources_match.group(0), new_sources_section)
+        visitor.append_to_section('PBXBuildFile', ''.join(build_file_parts))
+        visitor.replace(*files_span, ''.join(source_parts))
+        visitor.apply()
+
+def fix_build_phase():
+    """Fix the build phase to include all new files"""
+    
+    project_file = '/Users/jesse/IOS/WrestlePick/WrestlePick.xcodeproj/project.pbxproj'
+    
+    # Read project file and index its sections
+    visitor = PbxprojVisitor.load(project_file)
+    
+    fix_build_phase_step(visitor)
     
     # Write updated project file
-    with open(project_file, 'w') as f:
-        f.write(content)
+    visitor.save()
     
     print("✅ Successfully fixed build phase!")
 
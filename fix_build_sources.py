@@ -1,24 +1,16 @@
 #!/usr/bin/env python3
 
-import re
 import os
 
-def fix_build_sources():
-    project_file = "WrestlePick.xcodeproj/project.pbxproj"
-    
-    if not os.path.exists(project_file):
-        print(f"Error: {project_file} not found")
-        return
-    
-    with open(project_file, 'r') as f:
-        content = f.read()
+from pbxproj_utils import BUILDFILE_TMPL, FILEREF_TMPL, iter_swift_files, stable_id
+from pbxproj_visitor import PbxprojVisitor, SOURCES_HEAD_RE
+
+def fix_build_sources_step(visitor):
+    """Add every Swift file under WrestlePick/ to the file, build file and Sources sections in visitor"""
     
-    # Find all Swift files in the project
-    swift_files = []
-    for root, dirs, files in os.walk("WrestlePick"):
-        for file in files:
-            if file.endswith('.swift'):
-                swift_files.append(file)
+    # Find all Swift files in the project that are not referenced yet
+    uuid_by_name = visitor.uuid_by_name()
+    swift_files = sorted(name for name in (path.rsplit('/', 1)[-1] for path in iter_swift_files("WrestlePick")) if name not in uuid_by_name)
     
     print(f"Found Swift files: {swift_files}")
     
@@ -27,53 +19,50 @@ def fix_build_sources():
     file_ref_entries = []
     sources_entries = []
     
-    for i, swift_file in enumerate(swift_files):
-        # Generate unique IDs
-        file_ref_id = f"88F0{i:04d}2E6D19A2009FEB41"
-        build_file_id = f"88F0{i:04d}2E6D19A2009FEB42"
+    for swift_file in swift_files:
+        # Derive IDs from the file name so they cannot collide with existing objects
+        file_ref_id = stable_id(swift_file, 'fileRef')
+        build_file_id = stable_id(swift_file, 'buildFile')
         
         # Create file reference entry
-        file_ref_entry = f"\t\t{file_ref_id} /* {swift_file} */ = {{isa = PBXFileReference; lastKnownFileType = sourcecode.swift; path = {swift_file}; sourceTree = \"<group>\"; }};"
+        file_ref_entry = FILEREF_TMPL % (file_ref_id, swift_file, swift_file)
         file_ref_entries.append(file_ref_entry)
         
         # Create build file entry
-        build_file_entry = f"\t\t{build_file_id} /* {swift_file} in Sources */ = {{isa = PBXBuildFile; fileRef = {file_ref_id} /* {swift_file} */; }};"
+        build_file_entry = BUILDFILE_TMPL % (build_file_id, swift_file, file_ref_id, swift_file)
         build_file_entries.append(build_file_entry)
         
         # Create sources entry
-        sources_entry = f"\t\t\t\t\t\t{build_file_id} /* {swift_file} in Sources */,"
+        sources_entry = f"\n\t\t\t\t{build_file_id} /* {swift_file} in Sources */,"
         sources_entries.append(sources_entry)
     
     # Add file references to the PBXFileReference section
-    file_ref_pattern = r'(/\* Begin PBXFileReference section \*/.*?)(/\* End PBXFileReference section \*/)'
-    file_ref_section = re.search(file_ref_pattern, content, re.DOTALL)
-    
-    if file_ref_section:
-        existing_refs = file_ref_section.group(1)
-        new_refs = existing_refs + '\n'.join(file_ref_entries) + '\n'
-        content = content.replace(file_ref_section.group(1), new_refs)
+    visitor.append_to_section('PBXFileReference', ''.join(file_ref_entries))
     
     # Add build file entries to the PBXBuildFile section
-    build_file_pattern = r'(/\* Begin PBXBuildFile section \*/.*?)(/\* End PBXBuildFile section \*/)'
-    build_file_section = re.search(build_file_pattern, content, re.DOTALL)
-    
-    if build_file_section:
-        existing_build_files = build_file_section.group(1)
-        new_build_files = existing_build_files + '\n'.join(build_file_entries) + '\n'
-        content = content.replace(build_file_section.group(1), new_build_files)
+    visitor.append_to_section('PBXBuildFile', ''.join(build_file_entries))
     
     # Add sources entries to the Sources build phase
-    sources_pattern = r'(/\* Sources \*/ = \{[^}]*files = \([^}]*)(\s*\);.*?/\* End PBXSourcesBuildPhase \*/)'
-    sources_section = re.search(sources_pattern, content, re.DOTALL)
+    files_span = visitor.list_span('PBXSourcesBuildPhase', SOURCES_HEAD_RE, 'files')
+    
+    if files_span:
+        visitor.insert(files_span[1], ''.join(sources_entries))
+    
+    visitor.apply()
+
+def fix_build_sources():
+    project_file = "WrestlePick.xcodeproj/project.pbxproj"
+    
+    if not os.path.exists(project_file):
+        print(f"Error: {project_file} not found")
+        return
+    
+    visitor = PbxprojVisitor.load(project_file)
     
-    if sources_section:
-        existing_sources = sources_section.group(1)
-        new_sources = existing_sources + '\n'.join(sources_entries) + '\n'
-        content = content.replace(sources_section.group(1), new_sources)
+    fix_build_sources_step(visitor)
     
     # Write the updated content back
-    with open(project_file, 'w') as f:
-        f.write(content)
+    visitor.save()
     
     print("Successfully added all Swift files to build sources")
 
@@ -1,124 +1,119 @@
 #!/usr/bin/env python3
 
 import re
-import uuid
 
-def fix_complete_integration():
-    """Completely fix the Xcode project integration"""
-    
-    project_file = '/Users/jesse/IOS/WrestlePick/WrestlePick.xcodeproj/project.pbxproj'
+from pbxproj_utils import BUILDFILE_TMPL, FILEREF_TMPL, stable_id
+from pbxproj_visitor import MAIN_GROUP_HEAD_RE, PbxprojVisitor, SOURCES_HEAD_RE
+
+SOURCE_ENTRY_RE = re.compile(r'/\* (\S+\.swift) in Sources \*/')
+
+# All Swift files that should be in the project
+ALL_FILES = [
+    'WrestlePickApp.swift',
+    'ContentView.swift',
+    'RealDataModels.swift',
+    'RealNewsView.swift',
+    'RealRSSManager.swift',
+    'SimpleNewsView.swift',
+    'SimpleRSSManager.swift',
+    'RealDataPredictionsView.swift',
+    'CreatePredictionView.swift',
+    'RealDataAwardsView.swift',
+    'RealDataProfileView.swift',
+    'FantasyBookingView.swift',
+    'CreateBookingView.swift',
+    'PredictionService.swift',
+    'AwardsService.swift',
+    'UserService.swift',
+    'BookingService.swift',
+    'Award.swift',
+    'PredictionModels.swift',
+    'FantasyBookingModels.swift',
+    'User.swift'
+]
+
+def fix_complete_integration_step(visitor):
+    """Rebuild the file, build file and Sources sections in visitor for ALL_FILES"""
     
     print("🔧 Completely fixing Xcode project integration...")
     
-    # Read project file
-    with open(project_file, 'r') as f:
-        content = f.read()
-    
-    # All Swift files that should be in the project
-    all_files = [
-        'WrestlePickApp.swift',
-        'ContentView.swift',
-        'RealDataModels.swift',
-        'RealNewsView.swift',
-        'RealRSSManager.swift',
-        'SimpleNewsView.swift',
-        'SimpleRSSManager.swift',
-        'RealDataPredictionsView.swift',
-        'CreatePredictionView.swift',
-        'RealDataAwardsView.swift',
-        'RealDataProfileView.swift',
-        'FantasyBookingView.swift',
-        'CreateBookingView.swift',
-        'PredictionService.swift',
-        'AwardsService.swift',
-        'UserService.swift',
-        'BookingService.swift',
-        'Award.swift',
-        'PredictionModels.swift',
-        'FantasyBookingModels.swift',
-        'User.swift'
-    ]
-    
-    # Generate UUIDs for all files
+    # Derive IDs from the file names so rerunning leaves the project unchanged
     file_uuids = {}
-    for file_name in all_files:
-        file_uuids[file_name] = str(uuid.uuid4()).replace('-', '').upper()[:24]
+    build_uuids = {}
+    for file_name in ALL_FILES:
+        file_uuids[file_name] = stable_id(file_name, 'fileRef')
+        build_uuids[file_name] = stable_id(file_name, 'buildFile')
     
-    print(f"Processing {len(all_files)} files...")
+    print(f"Processing {len(ALL_FILES)} files...")
     
     # 1. Clear and rebuild PBXFileReference section
-    file_ref_pattern = r'/\* Begin PBXFileReference section \*/(.*?)/\* End PBXFileReference section \*/'
-    file_ref_match = re.search(file_ref_pattern, content, re.DOTALL)
-    
-    if file_ref_match:
-        new_file_refs = ""
-        for file_name in all_files:
-            file_uuid = file_uuids[file_name]
-            new_file_refs += f'\t\t{file_uuid} /* {file_name} */ = {{isa = PBXFileReference; lastKnownFileType = sourcecode.swift; path = "{file_name}"; sourceTree = "<group>"; }};\n'
+    if 'PBXFileReference' in visitor.sections:
+        new_file_refs = ''.join(FILEREF_TMPL % (file_uuids[file_name], file_name, file_name) for file_name in ALL_FILES)
         
-        new_file_ref_section = f'/* Begin PBXFileReference section */{new_file_refs}/* End PBXFileReference section */'
-        content = content.replace(file_ref_match.group(0), new_file_ref_section)
+        visitor.replace_section('PBXFileReference', new_file_refs)
         print("  ✅ Rebuilt PBXFileReference section")
     
     # 2. Clear and rebuild PBXBuildFile section
-    build_file_pattern = r'/\* Begin PBXBuildFile section \*/(.*?)/\* End PBXBuildFile section \*/'
-    build_file_match = re.search(build_file_pattern, content, re.DOTALL)
-    
-    if build_file_match:
-        new_build_files = ""
-        for file_name in all_files:
-            file_uuid = file_uuids[file_name]
-            build_uuid = str(uuid.uuid4()).replace('-', '').upper()[:24]
-            new_build_files += f'\t\t{build_uuid} /* {file_name} in Sources */ = {{isa = PBXBuildFile; fileRef = {file_uuid} /* {file_name} */; }};\n'
+    if 'PBXBuildFile' in visitor.sections:
+        new_build_files = ''.join(BUILDFILE_TMPL % (build_uuids[file_name], file_name, file_uuids[file_name], file_name) for file_name in ALL_FILES)
         
-        new_build_file_section = f'/* Begin PBXBuildFile section */{new_build_files}/* End PBXBuildFile section */'
-        content = content.replace(build_file_match.group(0), new_build_file_section)
+        visitor.replace_section('PBXBuildFile', new_build_files)
         print("  ✅ Rebuilt PBXBuildFile section")
     
     # 3. Clear and rebuild Sources build phase
-    sources_pattern = r'/\* Sources \*/ = \{{(.*?)\}};'
-    sources_match = re.search(sources_pattern, content, re.DOTALL)
-    
-    if sources_match:
-        new_sources = ""
-        for file_name in all_files:
-            file_uuid = file_uuids[file_name]
-            build_uuid = str(uuid.uuid4()).replace('-', '').upper()[:24]
-            new_sources += f'\t\t\t\t{build_uuid} /* {file_name} in Sources */,\n'
+    files_span = visitor.list_span('PBXSourcesBuildPhase', SOURCES_HEAD_RE, 'files')
+    
+    if files_span:
+        new_sources = ''.join(f'\n\t\t\t\t{build_uuids[file_name]} /* {file_name} in Sources */,' for file_name in ALL_FILES)
         
-        new_sources_section = f'/* Sources */ = {{{new_sources}}};'
-        content = content.replace(sources_match.group(0), new_sources_section)
+        visitor.replace(*files_span, new_sources)
         print("  ✅ Rebuilt Sources build phase")
     
     # 4. Update main group to include all files
-    main_group_pattern = r'/\* WrestlePick \*/ = \{{(.*?)\}};'
-    main_group_match = re.search(main_group_pattern, content, re.DOTALL)
+    children_span = visitor.list_span('PBXGroup', MAIN_GROUP_HEAD_RE, 'children')
     
-    if main_group_match:
-        group_content = main_group_match.group(1)
-        
-        # Add all file references
-        for file_name in all_files:
-            file_uuid = file_uuids[file_name]
-            group_content += f'\t\t\t\t{file_uuid} /* {file_name} */,\n'
+    if children_span:
+        # Add the file references the group does not already list
+        existing_children = visitor.content[children_span[0]:children_span[1]]
+        group_content = ''.join(f'\n\t\t\t\t{file_uuids[file_name]} /* {file_name} */,' for file_name in ALL_FILES if f'{file_uuids[file_name]} /* {file_name} */' not in existing_children)
         
-        new_main_group_section = f'/* WrestlePick */ = {{{group_content}}};'
-        content = content.replace(main_group_match.group(0), new_main_group_section)
+        visitor.insert(children_span[1], group_content)
         print("  ✅ Updated main group")
     
+    visitor.apply()
+
+def verify_integration(content):
+    """Report which of ALL_FILES the project compiles, and any sources it compiles beyond them"""
+    print("\n🔍 Verifying integration...")
+    
+    # Collect every compiled Swift file in one scan, then check membership
+    present = set(SOURCE_ENTRY_RE.findall(content))
+    for file_name in ALL_FILES:
+        if file_name in present:
+            print(f"  ✅ {file_name} found in project file")
+        else:
+            print(f"  ❌ {file_name} NOT found in project file")
+    
+    for file_name in sorted(present.difference(ALL_FILES)):
+        print(f"  ⚠️ {file_name} is in Sources but not in ALL_FILES")
+
+def fix_complete_integration():
+    """Completely fix the Xcode project integration"""
+    
+    project_file = '/Users/jesse/IOS/WrestlePick/WrestlePick.xcodeproj/project.pbxproj'
+    
+    # Read project file and index its sections
+    visitor = PbxprojVisitor.load(project_file)
+    
+    fix_complete_integration_step(visitor)
+    
     # Write updated project file
-    with open(project_file, 'w') as f:
-        f.write(content)
+    visitor.save()
     
     print("✅ Successfully fixed complete Xcode project integration!")
     
     # Verify integration
-    print("\n🔍 Verifying integration...")
-    for file_name in all_files:
-        if file_name in content:
-            print(f"  ✅ {file_name} found in project file")
-        else:
-            print(f"  ❌ {file_name} NOT found in project file")
+    verify_integration(visitor.content)
 
 if __name__ == "__main__":
     fix_complete_integration()
\ No newline at end of file
@@ -3,15 +3,12 @@
 import re
 import os
 
-def fix_file_paths():
-    project_file = "WrestlePick.xcodeproj/project.pbxproj"
-    
-    if not os.path.exists(project_file):
-        print(f"Error: {project_file} not found")
-        return
-    
-    with open(project_file, 'r') as f:
-        content = f.read()
+from pbxproj_visitor import PbxprojVisitor
+
+PATH_RE = re.compile(r'\t\t[0-9A-F]+\s+/\*\s+([^*\s]+)\s+\*/\s+=\s+\{isa\s+=\s+PBXFileReference;\s+lastKnownFileType\s+=\s+sourcecode\.swift;\s+path\s+=\s+([^;\s]+)\s*;\s*sourceTree\s+=\s+"<group>";\s+\};')
+
+def fix_file_paths_step(visitor):
+    """Point bare-path Swift file references in visitor at WrestlePick/"""
     
     # Find all Swift file references that need path fixes
     swift_files = [
@@ -34,19 +31,29 @@ def fix_file_paths():
         'NewsService.swift'
     ]
     
-    # Fix file paths for each Swift file
-    for swift_file in swift_files:
-        # Pattern to match file references that need path updates
-        pattern = rf'(\t\t[0-9A-F]+\s+\/\*\s+{re.escape(swift_file)}\s+\*\/\s+=\s+\{{isa\s+=\s+PBXFileReference;\s+lastKnownFileType\s+=\s+sourcecode\.swift;\s+path\s+=\s+){re.escape(swift_file)}(\s*;\s*sourceTree\s+=\s+"<group>";\s+\}};)'
-        
-        # Replace with correct path
-        replacement = rf'\1WrestlePick/{swift_file}\2'
-        
-        content = re.sub(pattern, replacement, content)
+    # Fix file paths for every targeted reference found in a single scan
+    targets = set(swift_files)
+    for match in PATH_RE.finditer(visitor.content):
+        swift_file = match.group(1)
+        if swift_file in targets and match.group(2) == swift_file:
+            # Replace with correct path
+            visitor.replace(match.start(2), match.end(2), f'WrestlePick/{swift_file}')
+    
+    visitor.apply()
+
+def fix_file_paths():
+    project_file = "WrestlePick.xcodeproj/project.pbxproj"
+    
+    if not os.path.exists(project_file):
+        print(f"Error: {project_file} not found")
+        return
+    
+    visitor = PbxprojVisitor.load(project_file)
+    
+    fix_file_paths_step(visitor)
     
     # Write the updated content back
-    with open(project_file, 'w') as f:
-        f.write(content)
+    visitor.save()
     
     print("Successfully fixed file paths in project.pbxproj")
 
@@ -2,45 +2,40 @@
 
 import re
 
-def fix_firebase_dependency():
-    """Fix Firebase dependency in Xcode project file"""
-    
-    project_file = "WrestlePick.xcodeproj/project.pbxproj"
+from pbxproj_utils import mapped_contains, section_span
+from pbxproj_visitor import PbxprojVisitor
+
+ROOT_OBJECT_RE = re.compile(r'(rootObject = [^;]+;)')
+PRODUCT_DEPS_RE = re.compile(r'(packageProductDependencies = \([^)]*?)\s*\);')
+TARGET_RE = re.compile(r'(buildPhases = \([^)]*?\);.*?buildSettings = \([^)]*?\);.*?buildConfigurationList = [^;]+;)')
+
+def fix_firebase_dependency_step(visitor):
+    """Add the Firebase package and products to visitor; returns False if nothing was added"""
     
     print("🔧 Fixing Firebase dependency...")
     
-    # Read the project file
-    with open(project_file, 'r') as f:
-        content = f.read()
+    content = visitor.content
     
     # Check if Firebase package is already referenced
     if "firebase-ios-sdk" in content:
         print("✅ Firebase package already referenced")
-        return
-    
-    # Add Firebase package reference
-    # Find the XCRemoteSwiftPackageReference section
-    package_ref_pattern = r'(XCRemoteSwiftPackageReference.*?\{[^}]*\})'
+        return False
     
     # Add Firebase package reference
-    firebase_package = '''
-		88F074142E6D19A2009FEB42 /* XCRemoteSwiftPackageReference "firebase-ios-sdk" */ = {
+    firebase_package = '''		88F074142E6D19A2009FEB42 /* XCRemoteSwiftPackageReference "firebase-ios-sdk" */ = {
 			isa = XCRemoteSwiftPackageReference;
 			repositoryURL = "https://github.com/firebase/firebase-ios-sdk.git";
 			requirement = {
 				kind = upToNextMajorVersion;
 				minimumVersion = 10.0.0;
 			};
-		};'''
+		};
+'''
     
-    # Find where to insert the package reference
-    if "XCRemoteSwiftPackageReference" in content:
-        # Insert after existing package references
-        content = re.sub(
-            r'(XCRemoteSwiftPackageReference.*?\{[^}]*\})',
-            r'\1' + firebase_package,
-            content
-        )
+    # Append to the end of the existing package reference section
+    span = section_span(content, 'XCRemoteSwiftPackageReference')
+    if span:
+        content = content[:span[1]] + firebase_package + content[span[1]:]
     else:
         # Add package references section
         package_section = '''
@@ -54,11 +49,11 @@ def fix_firebase_dependency():
 		};'''
         
         # Find the root object and add package references
-        content = re.sub(
-            r'(rootObject = [^;]+;)',
-            r'\1' + package_section,
-            content
-        )
+        content, count = ROOT_OBJECT_RE.subn(r'\1' + package_section, content, count=1)
+        
+        if not count:
+            print("❌ Could not find where to add the Firebase package")
+            return False
     
     # Add Firebase products to package product dependencies
     firebase_products = '''
@@ -67,13 +62,9 @@ def fix_firebase_dependency():
 				88F074142E6D19A2009FEB45 /* FirebaseAnalytics */,'''
     
     # Find package product dependencies section
-    if "packageProductDependencies" in content:
-        content = re.sub(
-            r'(packageProductDependencies = \([^)]*?)(\);',
-            r'\1' + firebase_products + r'\n\t\t\t);',
-            content
-        )
-    else:
+    content, count = PRODUCT_DEPS_RE.subn(r'\1' + firebase_products + r'\n\t\t\t);', content, count=1)
+    
+    if not count:
         # Add package product dependencies section
         package_deps = '''
 		packageProductDependencies = (
@@ -81,15 +72,29 @@ def fix_firebase_dependency():
 		);'''
         
         # Find the target section and add package dependencies
-        content = re.sub(
-            r'(buildPhases = \([^)]*?\);.*?buildSettings = \([^)]*?\);.*?buildConfigurationList = [^;]+;)',
-            r'\1' + package_deps,
-            content
-        )
+        content = TARGET_RE.sub(r'\1' + package_deps, content, count=1)
+    
+    visitor.update(content)
+    return True
+
+def fix_firebase_dependency():
+    """Fix Firebase dependency in Xcode project file"""
+    
+    project_file = "WrestlePick.xcodeproj/project.pbxproj"
+    
+    # Check the mapped file first so an already-fixed project is never read into a str
+    if mapped_contains(project_file, b"firebase-ios-sdk"):
+        print("✅ Firebase package already referenced")
+        return
+    
+    # Read the project file
+    visitor = PbxprojVisitor.load(project_file)
+    
+    if not fix_firebase_dependency_step(visitor):
+        return
     
     # Write the updated content back
-    with open(project_file, 'w') as f:
-        f.write(content)
+    visitor.save()
     
     print("✅ Firebase dependency added!")
 
@@ -0,0 +1,54 @@
+#!/usr/bin/env python3
+"""
+Run every project.pbxproj fix in one pass: read once, apply each step in memory, write once
+"""
+
+import os
+
+from fix_build_phase import fix_build_phase_step
+from fix_build_sources import fix_build_sources_step
+from fix_complete_integration import fix_complete_integration_step, verify_integration
+from fix_file_paths import fix_file_paths_step
+from fix_firebase_dependency import fix_firebase_dependency_step
+from pbxproj_utils import file_digest
+from pbxproj_visitor import PbxprojVisitor
+
+# Bump whenever a step changes so projects fixed by an older version are processed again
+FIX_VERSION = 1
+
+def main():
+    project_file = "WrestlePick.xcodeproj/project.pbxproj"
+    marker_file = project_file + ".fixmarker"
+
+    if not os.path.exists(project_file):
+        print(f"Error: {project_file} not found")
+        return
+
+    # Skip everything if the project is byte-for-byte what the last run of this version wrote
+    if os.path.exists(marker_file):
+        with open(marker_file, 'r') as f:
+            if f.read() == f"{file_digest(project_file)}:{FIX_VERSION}":
+                print("✅ Xcode project already fixed")
+                return
+
+    # Read and index the project once; each step sees the previous step's output
+    visitor = PbxprojVisitor.load(project_file)
+
+    fix_file_paths_step(visitor)
+    fix_firebase_dependency_step(visitor)
+    fix_build_sources_step(visitor)
+    fix_build_phase_step(visitor)
+    fix_complete_integration_step(visitor)
+
+    # Write the result back once
+    visitor.save()
+
+    with open(marker_file, 'w') as f:
+        f.write(f"{file_digest(project_file)}:{FIX_VERSION}")
+
+    print("✅ Successfully fixed Xcode project!")
+
+    verify_integration(visitor.content)
+
+if __name__ == "__main__":
+    main()
@@ -2,6 +2,10 @@
 
 import re
 
+from pbxproj_visitor import PbxprojVisitor
+
+QUOTED_REF_RE = re.compile(r'([A-F0-9]{24}) /\* ([^*]+?) \*/ = \{isa = PBXFileReference; lastKnownFileType = sourcecode\.swift; path = "([^"]+)"; sourceTree = "<group>"; \};')
+
 def fix_project_paths():
     """Fix project file to reference correct file paths"""
     
@@ -10,8 +14,8 @@ def fix_project_paths():
     print("🔧 Fixing project file paths...")
     
     # Read project file
-    with open(project_file, 'r') as f:
-        content = f.read()
+    visitor = PbxprojVisitor.load(project_file)
+    content = visitor.content
     
     # Files that need to be fixed
     files_to_fix = [
@@ -31,24 +35,28 @@ def fix_project_paths():
         'User.swift'
     ]
     
+    # Collect the targeted file references whose quoted path is just their own name in a single scan
+    targets = set(files_to_fix)
+    wrong_refs = {}
+    for match in QUOTED_REF_RE.finditer(content):
+        file_name = match.group(2)
+        if file_name in targets and file_name == match.group(3):
+            wrong_refs.setdefault(file_name, match)
+    
     # Fix file references
     for file_name in files_to_fix:
         # Find the file reference with wrong path
-        wrong_path_pattern = rf'([A-F0-9]{{24}}) /\* {re.escape(file_name)} \*/ = \{{isa = PBXFileReference; lastKnownFileType = sourcecode\.swift; path = "{re.escape(file_name)}"; sourceTree = "<group>"; \}};'
-        wrong_match = re.search(wrong_path_pattern, content)
+        wrong_match = wrong_refs.get(file_name)
         
         if wrong_match:
-            file_uuid = wrong_match.group(1)
             # Replace with correct path
-            correct_ref = f'{file_uuid} /* {file_name} */ = {{isa = PBXFileReference; lastKnownFileType = sourcecode.swift; path = "{file_name}"; sourceTree = "<group>"; }};'
-            content = content.replace(wrong_match.group(0), correct_ref)
+            visitor.replace(wrong_match.start(3), wrong_match.end(3), file_name)
             print(f"  ✅ Fixed path for {file_name}")
         else:
             print(f"  ❌ Could not find wrong path for {file_name}")
     
     # Write updated project file
-    with open(project_file, 'w') as f:
-        f.write(content)
+    visitor.save()
     
     print("✅ Successfully fixed project file paths!")
 
@@ -5,135 +5,84 @@ This script properly adds all missing Swift files to the Xcode project
 """
 
 import re
-import uuid
-import os
+import sys
 
-def generate_uuid():
-    """Generate a 24-character UUID for Xcode project files"""
-    return ''.join(str(uuid.uuid4()).replace('-', '').upper()[:24])
+from pbxproj_utils import gen_id, read_pbxproj
+from pbxproj_visitor import MAIN_GROUP_HEAD_RE, PbxprojVisitor
+
+# Files to add to the project
+FILES_TO_ADD = [
+    'RealDataModels.swift',
+    'RealNewsView.swift',
+    'RealRSSManager.swift',
+    'SimpleNewsView.swift',
+    'SimpleRSSManager.swift'
+]
+FILE_NAME_RE = re.compile('|'.join(re.escape(file_name) for file_name in FILES_TO_ADD))
 
 def fix_xcode_integration():
     project_file = '/Users/jesse/IOS/WrestlePick/WrestlePick.xcodeproj/project.pbxproj'
     
-    # Files to add to the project
-    files_to_add = [
-        'RealDataModels.swift',
-        'RealNewsView.swift', 
-        'RealRSSManager.swift',
-        'SimpleNewsView.swift',
-        'SimpleRSSManager.swift'
-    ]
-    
     print("🔧 Fixing Xcode project integration...")
-    print(f"Adding {len(files_to_add)} files to Xcode project")
-    
-    # Read the project file
-    with open(project_file, 'r') as f:
-        content = f.read()
-    
-    # Generate UUIDs for all files
-    file_uuids = {}
-    build_file_uuids = {}
-    
-    for file_name in files_to_add:
-        file_uuids[file_name] = generate_uuid()
-        build_file_uuids[file_name] = generate_uuid()
-        print(f"  📄 {file_name} -> {file_uuids[file_name]}")
-    
-    # 1. Add file references to the main group
-    print("\n1. Adding file references...")
-    
-    # Find the main group section and add file references
-    main_group_pattern = r'(.*1A2B3C4D5E6F7890ABCDEF00 /\* WrestlePickApp\.swift \*/.*?;)(.*?children = \(.*?\);.*?sourceTree = "<group>";.*?};)'
-    
-    file_refs = ""
-    for file_name in files_to_add:
-        file_refs += f"\n\t\t\t\t{file_uuids[file_name]} /* {file_name} */;"
-    
-    main_group_replacement = r'\1' + file_refs + r'\n\t\t\t\2'
-    content = re.sub(main_group_pattern, main_group_replacement, content, flags=re.DOTALL)
+    print(f"Adding {len(FILES_TO_ADD)} files to Xcode project")
     
-    # 2. Add file reference definitions
-    print("2. Adding file reference definitions...")
+    # Read the project file and index its sections once; every insertion below is queued against this scan
+    visitor = PbxprojVisitor.load(project_file)
     
-    file_ref_definitions = ""
-    for file_name in files_to_add:
-        file_ref_definitions += f'''
-\t\t{file_uuids[file_name]} /* {file_name} */ = {{isa = PBXFileReference; lastKnownFileType = sourcecode.swift; path = {file_name}; sourceTree = "<group>"; }};'''
+    # Generate UUIDs for all files, logging them in one write
+    # The ID lists run parallel to FILES_TO_ADD
+    file_uuids = []
+    build_file_uuids = []
+    log_lines = []
     
-    # Find the last file reference definition and add after it
-    last_file_ref_pattern = r'(.*1A2B3C4D5E6F7890ABCDEF00 /\* WrestlePickApp\.swift \*/ = \{isa = PBXFileReference;.*?sourceTree = "<group>"; \};)'
-    last_file_ref_replacement = r'\1' + file_ref_definitions
+    for file_name in FILES_TO_ADD:
+        file_uuids.append(gen_id())
+        build_file_uuids.append(gen_id())
+        log_lines.append(f"  📄 {file_name} -> {file_uuids[-1]}")
     
-    content = re.sub(last_file_ref_pattern, last_file_ref_replacement, content, flags=re.DOTALL)
+    sys.stdout.write('\n'.join(log_lines) + '\n')
     
-    # 3. Add build file references to the sources build phase
-    print("3. Adding build file references...")
+    # 1. Add each file's reference, definition, build file and Sources entry
+    print("\n1. Adding file references and build files...")
     
-    build_file_refs = ""
-    for file_name in files_to_add:
-        build_file_refs += f"\n\t\t\t\t{build_file_uuids[file_name]} /* {file_name} in Sources */;"
+    visitor.add_source_files(list(zip(FILES_TO_ADD, file_uuids, build_file_uuids)), MAIN_GROUP_HEAD_RE)
     
-    # Find the sources build phase and add file references
-    sources_phase_pattern = r'(.*1A2B3C4D5E6F7890ABCDEF00 /\* WrestlePickApp\.swift in Sources \*/.*?;)(.*?runOnlyForDeploymentPostprocessing = 0;.*?};)'
-    sources_phase_replacement = r'\1' + build_file_refs + r'\n\t\t\t\2'
+    # 2. Write the updated content
+    print("2. Writing updated project file...")
     
-    content = re.sub(sources_phase_pattern, sources_phase_replacement, content, flags=re.DOTALL)
-    
-    # 4. Add build file definitions
-    print("4. Adding build file definitions...")
-    
-    build_file_definitions = ""
-    for file_name in files_to_add:
-        build_file_definitions += f'''
-\t\t{build_file_uuids[file_name]} /* {file_name} in Sources */ = {{isa = PBXBuildFile; fileRef = {file_uuids[file_name]} /* {file_name} */; }};'''
-    
-    # Find the last build file definition and add after it
-    last_build_file_pattern = r'(.*1A2B3C4D5E6F7890ABCDEF00 /\* WrestlePickApp\.swift in Sources \*/ = \{isa = PBXBuildFile;.*?fileRef = 1A2B3C4D5E6F7890ABCDEF00 /\* WrestlePickApp\.swift \*/; \};)'
-    last_build_file_replacement = r'\1' + build_file_definitions
-    
-    content = re.sub(last_build_file_pattern, last_build_file_replacement, content, flags=re.DOTALL)
-    
-    # 5. Write the updated content
-    print("5. Writing updated project file...")
-    
-    with open(project_file, 'w') as f:
-        f.write(content)
+    content = visitor.save()
     
     print("✅ Successfully fixed Xcode project integration!")
     print("\n📋 Summary:")
-    for file_name in files_to_add:
-        print(f"  ✅ {file_name} added to project")
+    log_lines = [f"  ✅ {file_name} added to project" for file_name in FILES_TO_ADD]
+    sys.stdout.write('\n'.join(log_lines) + '\n')
     
-    return True
+    return content
 
-def verify_integration():
-    """Verify that the files were properly added"""
+def verify_integration(content=None):
+    """Verify that the files were properly added, reading the project file only if content is not given"""
     project_file = '/Users/jesse/IOS/WrestlePick/WrestlePick.xcodeproj/project.pbxproj'
     
     print("\n🔍 Verifying integration...")
     
-    with open(project_file, 'r') as f:
-        content = f.read()
+    if content is None:
+        content = read_pbxproj(project_file)
     
-    files_to_check = [
-        'RealDataModels.swift',
-        'RealNewsView.swift', 
-        'RealRSSManager.swift',
-        'SimpleNewsView.swift',
-        'SimpleRSSManager.swift'
-    ]
-    
-    for file_name in files_to_check:
-        if file_name in content:
-            print(f"  ✅ {file_name} found in project file")
+    # Find every occurrence of any of the names in one scan, then check membership
+    found = set(FILE_NAME_RE.findall(content))
+    log_lines = []
+    for file_name in FILES_TO_ADD:
+        if file_name in found:
+            log_lines.append(f"  ✅ {file_name} found in project file")
         else:
-            print(f"  ❌ {file_name} NOT found in project file")
+            log_lines.append(f"  ❌ {file_name} NOT found in project file")
+    
+    sys.stdout.write('\n'.join(log_lines) + '\n')
 
 if __name__ == "__main__":
     try:
-        fix_xcode_integration()
-        verify_integration()
+        content = fix_xcode_integration()
+        verify_integration(content)
         print("\n🎉 Xcode integration fix completed successfully!")
     except Exception as e:
         print(f"❌ Error: {e}")
@@ -0,0 +1,144 @@
+#!/usr/bin/env python3
+"""
+Shared helpers for editing WrestlePick.xcodeproj/project.pbxproj
+"""
+
+import hashlib
+import mmap
+import os
+import re
+import shutil
+import tempfile
+
+FILE_REF_RE = re.compile(r'(/\* Begin PBXFileReference section \*/[^/]*(?:/(?!\* End PBXFileReference section \*/)[^/]*)*)(/\* End PBXFileReference section \*/)')
+BUILD_FILE_RE = re.compile(r'(/\* Begin PBXBuildFile section \*/[^/]*(?:/(?!\* End PBXBuildFile section \*/)[^/]*)*)(/\* End PBXBuildFile section \*/)')
+GROUP_RE = re.compile(r'(/\* WrestlePick \*/ = \{[^}]*children = \([\s\S]*?)(\s*\);)')
+SOURCES_RE = re.compile(r'(/\* Sources \*/ = \{[^}]*files = \([\s\S]*?)(\s*\);)')
+
+SKIP_DIRS = {'.git', '.svn', 'DerivedData', 'Build', 'build'}
+
+# Read and write the project in 1 MiB chunks rather than the default 8 KiB
+PBXPROJ_BUFSIZE = 1 << 20
+
+# %-templates for one Swift file's entries: (file_uuid, name, name) and (build_uuid, name, file_uuid, name)
+FILEREF_TMPL = '\t\t%s /* %s */ = {isa = PBXFileReference; lastKnownFileType = sourcecode.swift; path = %s; sourceTree = "<group>"; };\n'
+BUILDFILE_TMPL = '\t\t%s /* %s in Sources */ = {isa = PBXBuildFile; fileRef = %s /* %s */; };\n'
+
+def gen_id():
+    """Generate a 24-character hex ID for Xcode project objects"""
+    return os.urandom(12).hex().upper()
+
+def stable_id(file_name, role):
+    """Derive a 24-character hex ID from (file_name, role) so reruns produce the same objects"""
+    return hashlib.blake2b(f'{file_name}:{role}'.encode(), digest_size=12).hexdigest().upper()
+
+def mapped_contains(path, needle):
+    """Check whether a file contains a bytes needle"""
+    with open(path, 'rb') as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return False
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            return mm.find(needle) != -1
+
+def file_digest(path):
+    """Return a blake2b digest of a file's bytes"""
+    with open(path, 'rb') as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return hashlib.blake2b(digest_size=16).hexdigest()
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            return hashlib.blake2b(mm, digest_size=16).hexdigest()
+
+def section_span(content, name):
+    """Return the (begin, end) offsets of a section's body, or None if it is missing"""
+    header = f'/* Begin {name} section */'
+    begin = content.find(header)
+    if begin == -1:
+        return None
+    end = content.find(f'/* End {name} section */', begin)
+    if end == -1:
+        return None
+    return begin + len(header), end
+
+def iter_swift_files(root):
+    """Yield the paths of all Swift files under root, skipping build directories"""
+    if not os.path.isdir(root):
+        return
+    with os.scandir(root) as it:
+        for entry in it:
+            if entry.is_dir(follow_symlinks=False):
+                if entry.name in SKIP_DIRS:
+                    continue
+                yield from iter_swift_files(entry.path)
+            elif entry.name.endswith('.swift'):
+                yield entry.path
+
+def _insert(content, pattern, text):
+    """Splice text in between the two groups of the first match of pattern"""
+    match = pattern.search(content)
+    if not match:
+        return content
+    return content[:match.end(1)] + text + content[match.start(2):]
+
+def _append_to_section(content, name, text):
+    """Splice text in just before a section's End marker"""
+    span = section_span(content, name)
+    if not span:
+        return content
+    return content[:span[1]] + text + content[span[1]:]
+
+def insert_file_ref(content, refs):
+    """Add (file_uuid, file_name) pairs to the PBXFileReference section"""
+    text = ''.join(FILEREF_TMPL % (file_uuid, file_name, file_name) for file_uuid, file_name in refs)
+    return _append_to_section(content, 'PBXFileReference', text)
+
+def insert_build_file(content, build_files):
+    """Add (build_uuid, file_uuid, file_name) triples to the PBXBuildFile section"""
+    text = ''.join(BUILDFILE_TMPL % (build_uuid, file_name, file_uuid, file_name) for build_uuid, file_uuid, file_name in build_files)
+    return _append_to_section(content, 'PBXBuildFile', text)
+
+def insert_group_entry(content, children):
+    """Add (uuid, name) pairs to the children of the WrestlePick group"""
+    text = ''.join(f'\n\t\t\t\t{uuid} /* {name} */,' for uuid, name in children)
+    return _insert(content, GROUP_RE, text)
+
+def insert_source_entry(content, sources):
+    """Add (build_uuid, file_name) pairs to the Sources build phase"""
+    text = ''.join(f'\n\t\t\t\t{build_uuid} /* {file_name} in Sources */,' for build_uuid, file_name in sources)
+    return _insert(content, SOURCES_RE, text)
+
+def iter_spliced(data, edits):
+    """Yield data with (start, end, text) edits spliced in"""
+    prev = 0
+    for start, end, text in sorted(edits, key=lambda edit: edit[:2]):
+        yield data[prev:start]
+        yield text
+        prev = end
+    yield data[prev:]
+
+def apply_edits(content, edits):
+    """Splice (offset, text) inserts into content in a single pass"""
+    return ''.join(iter_spliced(content, [(offset, offset, text) for offset, text in edits]))
+
+def read_pbxproj(path):
+    """Read a project file as UTF-8 through a PBXPROJ_BUFSIZE buffer"""
+    with open(path, 'rb', buffering=PBXPROJ_BUFSIZE) as f:
+        return f.read().decode('utf-8')
+
+def _replace_with(path, write):
+    """Replace path atomically with what write(f) produces"""
+    fd, tmp = tempfile.mkstemp(dir=os.path.dirname(path) or '.')
+    try:
+        with os.fdopen(fd, 'wb', buffering=PBXPROJ_BUFSIZE) as f:
+            write(f)
+            # Make sure the new contents are on disk before they replace the old file
+            f.flush()
+            os.fsync(f.fileno())
+        shutil.copymode(path, tmp)
+        os.replace(tmp, path)
+    except BaseException:
+        os.unlink(tmp)
+        raise
+
+def write_pbxproj(path, content):
+    """Write content to a sibling temp file and swap it in over path"""
+    _replace_with(path, lambda f: f.write(content.encode('utf-8')))
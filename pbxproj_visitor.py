@@ -0,0 +1,127 @@
+#!/usr/bin/env python3
+"""
+Single-scan section index and edit buffer for project.pbxproj
+"""
+
+import re
+
+from pbxproj_utils import BUILDFILE_TMPL, FILEREF_TMPL, iter_spliced, read_pbxproj, write_pbxproj
+
+INDEX_RE = re.compile(r'([A-F0-9]{24}) /\* ([^*]+?) \*/')
+SOURCES_HEAD_RE = re.compile(r'[A-F0-9]{24} /\* Sources \*/ = \{')
+MAIN_GROUP_HEAD_RE = re.compile(r'[A-F0-9]{24} /\* WrestlePick \*/ = \{')
+
+def _index_sections(content):
+    """Map each section name to its (start, body_start, body_end, end) offsets"""
+    sections = {}
+    pos = content.find('/* Begin ')
+    while pos != -1:
+        name_start = pos + len('/* Begin ')
+        name_end = content.find(' section */', name_start)
+        if name_end == -1:
+            break
+        name = content[name_start:name_end]
+        body_start = name_end + len(' section */')
+        end_marker = f'/* End {name} section */'
+        body_end = content.find(end_marker, body_start)
+        if body_end == -1:
+            break
+        sections[name] = (pos, body_start, body_end, body_end + len(end_marker))
+        pos = content.find('/* Begin ', body_end)
+    return sections
+
+class PbxprojVisitor:
+    """Locate every section once and collect (start, end, text) edits against the original content"""
+
+    def __init__(self, content, path=None):
+        self.path = path
+        self.update(content)
+
+    def update(self, content):
+        """Replace the content wholesale, reindexing sections and dropping queued edits"""
+        self.content = content
+        self.sections = _index_sections(content)
+        self.edits = []
+        self._uuid_index = None
+
+    @classmethod
+    def load(cls, path):
+        """Read a project file and index its sections"""
+        return cls(read_pbxproj(path), path)
+
+    def uuid_by_name(self):
+        """Map each commented name to the first UUID it follows, built once per content"""
+        if self._uuid_index is None:
+            self._uuid_index = {}
+            for match in INDEX_RE.finditer(self.content):
+                self._uuid_index.setdefault(match.group(2), match.group(1))
+        return self._uuid_index
+
+    def list_span(self, name, head, key):
+        """Return the (start, end) offsets of the key list in the first object matching head"""
+        span = self.sections.get(name)
+        if not span:
+            return None
+        match = head.search(self.content, span[0], span[3])
+        if not match:
+            return None
+        opener = f'{key} = ('
+        start = self.content.find(opener, match.end(), span[3])
+        if start == -1:
+            return None
+        start += len(opener)
+        close = self.content.find(');', start, span[3])
+        if close == -1:
+            return None
+        # End just after the last entry so inserts land before the closing indentation
+        return start, start + len(self.content[start:close].rstrip())
+
+    def replace(self, start, end, text):
+        """Queue content[start:end] to be replaced with text"""
+        self.edits.append((start, end, text))
+
+    def insert(self, offset, text):
+        """Queue text to be inserted at offset"""
+        self.edits.append((offset, offset, text))
+
+    def replace_section(self, name, body):
+        """Queue the body of a section to be replaced; returns False if the section is missing"""
+        span = self.sections.get(name)
+        if not span:
+            return False
+        self.replace(span[1], span[2], body)
+        return True
+
+    def append_to_section(self, name, text):
+        """Queue text to be inserted just before a section's End marker"""
+        span = self.sections.get(name)
+        if not span:
+            return False
+        self.insert(span[2], text)
+        return True
+
+    def add_source_files(self, files, group_head):
+        """Queue (file_name, file_uuid, build_uuid) entries for every section and the group matching group_head"""
+        self.append_to_section('PBXFileReference', ''.join(FILEREF_TMPL % (file_uuid, file_name, file_name) for file_name, file_uuid, _ in files))
+        self.append_to_section('PBXBuildFile', ''.join(BUILDFILE_TMPL % (build_uuid, file_name, file_uuid, file_name) for file_name, file_uuid, build_uuid in files))
+        files_span = self.list_span('PBXSourcesBuildPhase', SOURCES_HEAD_RE, 'files')
+        if files_span:
+            self.insert(files_span[1], ''.join(f'\n\t\t\t\t{build_uuid} /* {file_name} in Sources */,' for file_name, _, build_uuid in files))
+        children_span = self.list_span('PBXGroup', group_head, 'children')
+        if children_span:
+            self.insert(children_span[1], ''.join(f'\n\t\t\t\t{file_uuid} /* {file_name} */,' for file_name, file_uuid, _ in files))
+
+    def render(self):
+        """Apply the queued edits in offset order and return the new content"""
+        return ''.join(iter_spliced(self.content, self.edits))
+
+    def apply(self):
+        """Render the queued edits into the content so later steps see them"""
+        if self.edits:
+            self.update(self.render())
+        return self.content
+
+    def save(self, path=None):
+        """Apply the queued edits and write the content back atomically"""
+        write_pbxproj(path or self.path, self.apply())
+        return self.content